@@ -8,9 +8,15 @@ Complete Plasmid Design Workflow
 
 """
 
-import subprocess
-import sys
+import contextlib
+import io
 import os
+import sys
+import traceback
+
+import plasmid_designer
+import test_plasmid_designer
+from plasmid_analyzer import PlasmidAnalyzer
 
 
 def print_section(title):
@@ -20,26 +26,35 @@ def print_section(title):
     print("="*70 + "\n")
 
 
-def run_command(cmd, description):
-   
-    print(f"→ {description}")
-    print(f"  Command: {' '.join(cmd)}\n")
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.returncode == 0:
-        print("✓ Success!")
-        if result.stdout:
-            print("\nOutput:")
-            print(result.stdout)
-    else:
+def run_step(description, func, *args):
+    # Steps run in-process rather than as python3 subprocesses, so there
+    # is no interpreter start-up or module re-import per step
+    print(f"→ {description}\n")
+    
+    output = io.StringIO()
+    
+    try:
+        with contextlib.redirect_stdout(output):
+            status = func(*args)
+    except SystemExit as e:
+        status = e.code
+    except Exception:
         print("✗ Failed!")
-        if result.stderr:
-            print("\nError:")
-            print(result.stderr)
+        print("\nError:")
+        print(traceback.format_exc())
         return False
     
-    return True
+    print("✗ Failed!" if status else "✓ Success!")
+    if output.getvalue():
+        print("\nOutput:")
+        print(output.getvalue())
+    
+    return not status
+
+
+def analyze_file(analyzer, filename):
+    header, sequence = analyzer.read_fasta(filename)
+    analyzer.print_analysis(header, sequence)
 
 
 def main():
@@ -79,10 +94,10 @@ def main():
     # Step 1: Design plasmid
     print_section("STEP 1: Design Custom Plasmid")
     
-    success = run_command(
-        ['python3', 'plasmid_designer.py', 
-         'pUC19.fa', 'Design_pUC19.txt', 'workflow_output.fa', 'markers.tab'],
-        "Designing plasmid based on pUC19 with custom specifications"
+    success = run_step(
+        "Designing plasmid based on pUC19 with custom specifications",
+        plasmid_designer.main,
+        ['pUC19.fa', 'Design_pUC19.txt', 'workflow_output.fa', 'markers.tab']
     )
     
     if not success:
@@ -91,9 +106,10 @@ def main():
     # Step 2: Run tests
     print_section("STEP 2: Run Validation Tests")
     
-    success = run_command(
-        ['python3', 'test_plasmid_designer.py'],
-        "Running comprehensive test suite"
+    success = run_step(
+        "Running comprehensive test suite",
+        test_plasmid_designer.main,
+        []
     )
     
     if not success:
@@ -102,9 +118,12 @@ def main():
     # Step 3: Analyze results
     print_section("STEP 3: Analyze Designed Plasmid")
     
-    success = run_command(
-        ['python3', 'plasmid_analyzer.py', 'workflow_output.fa'],
-        "Analyzing the designed plasmid"
+    # One analyzer serves both analysis steps
+    analyzer = PlasmidAnalyzer()
+    
+    success = run_step(
+        "Analyzing the designed plasmid",
+        analyze_file, analyzer, 'workflow_output.fa'
     )
     
     if not success:
@@ -114,9 +133,9 @@ def main():
     print_section("STEP 4: Compare with Original pUC19")
     
     print("Original pUC19:")
-    run_command(
-        ['python3', 'plasmid_analyzer.py', 'pUC19.fa'],
-        "Analyzing original pUC19"
+    run_step(
+        "Analyzing original pUC19",
+        analyze_file, analyzer, 'pUC19.fa'
     )
     
     # Summary
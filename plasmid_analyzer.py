@@ -7,60 +7,58 @@ Analyzes a plasmid sequence and provides detailed statistics
 and feature detection.
 """
 
+import re
 import sys
-from collections import Counter
+from bisect import bisect_left
+
+from plasmid_designer import (compile_site_patterns, find_site_positions, parse_fasta,
+                              parse_fasta_records)
+
+
+# Lookaheads so that overlapping codons (e.g. ATGA) are all reported
+START_CODON_RE = re.compile(b'(?=ATG)')
+STOP_CODON_RE = re.compile(b'(?=TAA|TAG|TGA)')
 
 
 class PlasmidAnalyzer:
     
     def __init__(self):
         self.restriction_enzymes = {
-            'EcoRI': 'GAATTC',
-            'BamHI': 'GGATCC',
-            'HindIII': 'AAGCTT',
-            'PstI': 'CTGCAG',
-            'SalI': 'GTCGAC',
-            'XbaI': 'TCTAGA',
-            'KpnI': 'GGTACC',
-            'SacI': 'GAGCTC',
-            'SmaI': 'CCCGGG',
-            'SphI': 'GCATGC',
-            'NotI': 'GCGGCCGC',
-            'XhoI': 'CTCGAG',
-            'NcoI': 'CCATGG',
-            'NdeI': 'CATATG',
-            'BglII': 'AGATCT',
-            'ApaI': 'GGGCCC',
-            'SpeI': 'ACTAGT',
-            'PvuII': 'CAGCTG'
+            'EcoRI': b'GAATTC',
+            'BamHI': b'GGATCC',
+            'HindIII': b'AAGCTT',
+            'PstI': b'CTGCAG',
+            'SalI': b'GTCGAC',
+            'XbaI': b'TCTAGA',
+            'KpnI': b'GGTACC',
+            'SacI': b'GAGCTC',
+            'SmaI': b'CCCGGG',
+            'SphI': b'GCATGC',
+            'NotI': b'GCGGCCGC',
+            'XhoI': b'CTCGAG',
+            'NcoI': b'CCATGG',
+            'NdeI': b'CATATG',
+            'BglII': b'AGATCT',
+            'ApaI': b'GGGCCC',
+            'SpeI': b'ACTAGT',
+            'PvuII': b'CAGCTG'
         }
+        
+        self.site_patterns = compile_site_patterns(self.restriction_enzymes.values())
     
     def read_fasta(self, filename):
-        header = ""
-        sequence = ""
-        
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('>'):
-                    header = line[1:]
-                else:
-                    sequence += line.upper()
-        
-        return header, sequence
+        return parse_fasta(filename)
+    
+    def read_fasta_records(self, filename):
+        """Return every (header, sequence) record of a multi-FASTA file"""
+        return parse_fasta_records(filename)
     
     def analyze_composition(self, sequence):
-        counts = Counter(sequence)
+        # bytes.count runs in C; five scans beat hashing every base in a Counter.
+        # Counting the byte value skips building a one-byte needle per base
+        composition = {base: sequence.count(ord(base)) for base in 'ATGCN'}
         total = len(sequence)
-        
-        composition = {
-            'A': counts.get('A', 0),
-            'T': counts.get('T', 0),
-            'G': counts.get('G', 0),
-            'C': counts.get('C', 0),
-            'N': counts.get('N', 0),
-            'Other': total - sum([counts.get(n, 0) for n in 'ATGCN'])
-        }
+        composition['Other'] = total - sum(composition.values())
         
         # Calculate percentages
         percentages = {base: (count/total*100) for base, count in composition.items()}
@@ -74,23 +72,16 @@ class PlasmidAnalyzer:
         return composition, percentages, gc_content, at_content
     
     def find_restriction_sites(self, sequence):
+        # All enzymes in one pass rather than a count + find loop per enzyme
+        hits = find_site_positions(self.site_patterns, sequence)
+        
         sites = {}
         
         for enzyme, site_seq in self.restriction_enzymes.items():
-            count = sequence.count(site_seq)
-            if count > 0:
-                # Find positions
-                positions = []
-                start = 0
-                while True:
-                    pos = sequence.find(site_seq, start)
-                    if pos == -1:
-                        break
-                    positions.append(pos)
-                    start = pos + 1
-                
+            if site_seq in hits:
+                positions = list(hits[site_seq])
                 sites[enzyme] = {
-                    'count': count,
+                    'count': len(positions),
                     'sequence': site_seq,
                     'positions': positions
                 }
@@ -98,39 +89,41 @@ class PlasmidAnalyzer:
         return sites
     
     def analyze_orfs(self, sequence):
-        # Start codons
-        start_codons = ['ATG']
-        stop_codons = ['TAA', 'TAG', 'TGA']
+        min_length = 300  # At least 100 amino acids
+        
+        # Locate every start and stop codon with the precompiled patterns
+        # (one C-level scan each) and bucket them by reading frame, so the
+        # Python loop below only touches codons that matter
+        starts = ([], [], [])
+        stops = ([], [], [])
+        for match in START_CODON_RE.finditer(sequence):
+            starts[match.start() % 3].append(match.start())
+        for match in STOP_CODON_RE.finditer(sequence):
+            stops[match.start() % 3].append(match.start())
         
         orfs = []
         
-        # Check all 3 reading frames
+        # Check all 3 reading frames: the ORF for each start ends at the
+        # first in-frame stop after it, found by binary search
         for frame in range(3):
-            pos = frame
-            while pos < len(sequence) - 2:
-                codon = sequence[pos:pos+3]
-                
-                if codon in start_codons:
-                    # Find stop codon
-                    orf_start = pos
-                    orf_pos = pos + 3
-                    
-                    while orf_pos < len(sequence) - 2:
-                        stop_codon = sequence[orf_pos:orf_pos+3]
-                        if stop_codon in stop_codons:
-                            orf_length = orf_pos - orf_start + 3
-                            if orf_length >= 300:  # At least 100 amino acids
-                                orfs.append({
-                                    'start': orf_start,
-                                    'end': orf_pos + 3,
-                                    'length': orf_length,
-                                    'frame': frame,
-                                    'aa_length': orf_length // 3
-                                })
-                            break
-                        orf_pos += 3
+            frame_stops = stops[frame]
+            
+            for orf_start in starts[frame]:
+                next_stop = bisect_left(frame_stops, orf_start + 3)
+                if next_stop == len(frame_stops):
+                    # No stop left for this or any later start
+                    break
                 
-                pos += 3
+                stop = frame_stops[next_stop]
+                orf_length = stop - orf_start + 3
+                if orf_length >= min_length:
+                    orfs.append({
+                        'start': orf_start,
+                        'end': stop + 3,
+                        'length': orf_length,
+                        'frame': frame,
+                        'aa_length': orf_length // 3
+                    })
         
         return orfs
     
@@ -175,7 +168,7 @@ class PlasmidAnalyzer:
                 if len(info['positions']) > 5:
                     pos_str += f" ... (+{len(info['positions'])-5} more)"
                 
-                print(f"{enzyme:<12} {info['count']:<6} {info['sequence']:<10} {pos_str}")
+                print(f"{enzyme:<12} {info['count']:<6} {info['sequence'].decode():<10} {pos_str}")
         else:
             print("\nNo restriction sites found for common enzymes")
         
@@ -214,19 +207,24 @@ class PlasmidAnalyzer:
         print("\n" + "="*70)
 
 
-def main():
-    if len(sys.argv) < 2:
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if len(argv) < 1:
         print("Usage: python3 plasmid_analyzer.py <plasmid.fa>")
         print("\nExample:")
         print("  python3 plasmid_analyzer.py Output.fa")
-        sys.exit(1)
+        return 1
     
-    filename = sys.argv[1]
+    filename = argv[0]
     
     analyzer = PlasmidAnalyzer()
     header, sequence = analyzer.read_fasta(filename)
     analyzer.print_analysis(header, sequence)
+    
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
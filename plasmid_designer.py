@@ -7,10 +7,169 @@ Plasmid Design Tool
 3. Marker database
 """
 
+import hashlib
+import os
+import pickle
 import re
 import sys
-from typing import Dict, List, Tuple, Optional
+import tempfile
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
 from collections import defaultdict
+from functools import lru_cache
+
+
+# Parsed markers databases, keyed by file path + mtime + size; bump the
+# version whenever the cached structure changes
+MARKERS_CACHE_VERSION = 2
+MARKERS_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'plasmid_designer'
+)
+
+# Bytes dropped from FASTA sequence lines, and the table that uppercases
+# the rest in the same translate() pass
+FASTA_WHITESPACE = b' \t\r\n\x0b\x0c'
+FASTA_UPPERCASE = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz',
+                                  b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+# A record starts at a '>' opening a line, after any indentation
+FASTA_RECORD_START = re.compile(rb'(?m)^[ \t\r\x0b\x0c]*>')
+
+# 256-entry lookup table mapping A/T to 1 and every other byte to 0
+AT_FLAGS = bytes(byte in b'AT' for byte in range(256))
+
+
+def compile_site_patterns(sites: Iterable[bytes]) -> List[Pattern]:
+    """
+    Compile recognition sites into regexes that find all of them in one scan
+    
+    Sites are grouped by length and each group is nested by shared prefix,
+    so at every position the regex engine walks a trie instead of retrying
+    each site in turn. The lookahead keeps overlapping hits. Compile once
+    per set of sites and pass the result to every find_site_positions call.
+    
+    Args:
+        sites: Recognition site sequences
+        
+    Returns:
+        One compiled pattern per distinct site length
+    """
+    by_length = defaultdict(set)
+    for site in sites:
+        by_length[len(site)].add(site)
+    
+    return [re.compile(b'(?=(' + _trie_regex(group) + b'))')
+            for length, group in sorted(by_length.items())]
+
+
+def _trie_regex(sites: Iterable[bytes]) -> bytes:
+    trie = {}
+    for site in sites:
+        node = trie
+        for i in range(len(site)):
+            node = node.setdefault(site[i:i+1], {})
+    
+    def emit(node):
+        branches = [re.escape(base) + emit(child) for base, child in sorted(node.items())]
+        if len(branches) == 1:
+            return branches[0]
+        return b'(?:' + b'|'.join(branches) + b')' if branches else b''
+    
+    return emit(trie)
+
+
+def find_site_positions(patterns: List[Pattern], sequence: bytes) -> Dict[bytes, List[int]]:
+    """
+    Scan a sequence once per pattern and collect every site occurrence
+    
+    Args:
+        patterns: Patterns from compile_site_patterns
+        sequence: DNA sequence to scan
+        
+    Returns:
+        Dictionary mapping each site found to its sorted start positions
+    """
+    positions = defaultdict(list)
+    for pattern in patterns:
+        for match in pattern.finditer(sequence):
+            positions[match.group(1)].append(match.start())
+    
+    return positions
+
+
+def parse_fasta(fasta_file: str) -> Tuple[str, bytes]:
+    """
+    Read a FASTA file and return header and sequence
+    
+    As before, records are concatenated and the last header wins; use
+    parse_fasta_records to keep them apart. The sequence stays ASCII
+    bytes; it is never decoded to str.
+    
+    Results are kept per (path, mtime, size), so a file read again in the
+    same process (e.g. pUC19.fa by both the designer and the analyzer in
+    complete_workflow.py) is parsed only once.
+    
+    Args:
+        fasta_file: Path to FASTA file
+        
+    Returns:
+        Tuple of (header, sequence)
+    """
+    stat = os.stat(fasta_file)
+    return _parse_fasta_file(os.path.abspath(fasta_file), stat.st_mtime_ns, stat.st_size)
+
+
+def parse_fasta_records(fasta_file: str) -> List[Tuple[str, bytes]]:
+    """
+    Read every record of a (multi-)FASTA file
+    
+    The file is read in one call and split on record boundaries by one
+    precompiled regex; each record's sequence is then stripped of
+    whitespace and uppercased by a single translate. No per-line Python
+    loop runs. A header may be indented, and sequence lines before the
+    first header form a record with an empty header.
+    
+    Args:
+        fasta_file: Path to FASTA file
+        
+    Returns:
+        List of (header, sequence) tuples in file order
+    """
+    stat = os.stat(fasta_file)
+    return list(_read_fasta_records(os.path.abspath(fasta_file), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _parse_fasta_file(fasta_file: str, mtime_ns: int, size: int) -> Tuple[str, bytes]:
+    records = _read_fasta_records(fasta_file, mtime_ns, size)
+    
+    if len(records) == 1:
+        return records[0]
+    if not records:
+        return "", b""
+    
+    return records[-1][0], b''.join(sequence for header, sequence in records)
+
+
+@lru_cache(maxsize=8)
+def _read_fasta_records(fasta_file: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, bytes], ...]:
+    with open(fasta_file, 'rb', buffering=0) as f:
+        data = f.read()
+    
+    leading, *chunks = FASTA_RECORD_START.split(data)
+    
+    records = []
+    
+    # Sequence lines before any header belong to an unnamed record
+    sequence = leading.translate(FASTA_UPPERCASE, FASTA_WHITESPACE)
+    if sequence:
+        records.append(("", sequence))
+    
+    for chunk in chunks:
+        header, _, body = chunk.partition(b'\n')
+        records.append((header.decode().rstrip(),
+                        body.translate(FASTA_UPPERCASE, FASTA_WHITESPACE)))
+    
+    return tuple(records)
 
 
 class PlasmidDesigner:
@@ -26,7 +185,9 @@ class PlasmidDesigner:
         self.restriction_sites = {}
         self.markers = self.load_markers(markers_file)
         
-    def load_markers(self, markers_file: str) -> Dict[str, Dict[str, str]]:
+        self.site_patterns = compile_site_patterns(self.restriction_sites.values())
+        
+    def load_markers(self, markers_file: str) -> Dict[str, Dict]:
         """
         Load markers from the database file
         
@@ -34,34 +195,42 @@ class PlasmidDesigner:
             markers_file: Path to markers.tab file
             
         Returns:
-            Dictionary of markers with their sequences and descriptions
+            Dictionary of markers with their sequences (as bytes) and descriptions
         """
         markers = {}
         
         try:
-            with open(markers_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
+            cache_file = self._markers_cache_file(markers_file)
+            cached = self._read_markers_cache(cache_file)
+            
+            if cached is not None:
+                markers, self.restriction_sites = cached
+            else:
+                with open(markers_file, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line or line.startswith('#'):
+                            continue
                     
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        name = parts[0]
-                        marker_type = parts[1]
-                        sequence = parts[2]
-                        description = parts[3] if len(parts) > 3 else ""
+                        parts = line.split('\t')
+                        if len(parts) >= 3:
+                            name = parts[0]
+                            marker_type = parts[1]
+                            sequence = parts[2].encode('ascii')
+                            description = parts[3] if len(parts) > 3 else ""
                         
-                        markers[name] = {
-                            'type': marker_type,
-                            'sequence': sequence,
-                            'description': description
-                        }
+                            markers[name] = {
+                                'type': marker_type,
+                                'sequence': sequence,
+                                'description': description
+                            }
                         
-                        # Store restriction enzyme recognition sites separately
-                        if marker_type == 'RE':
-                            self.restriction_sites[name] = sequence
-                            
+                            # Store restriction enzyme recognition sites separately
+                            if marker_type == 'RE':
+                                self.restriction_sites[name] = sequence
+                
+                self._write_markers_cache(cache_file, (markers, self.restriction_sites))
+            
             print(f"Loaded {len(markers)} markers from database")
             print(f"  - {len(self.restriction_sites)} restriction enzymes")
             print(f"  - {len([m for m in markers.values() if m['type'] == 'AmpR'])} antibiotic markers")
@@ -72,19 +241,72 @@ class PlasmidDesigner:
             
         return markers
     
+    def _markers_cache_file(self, markers_file: str) -> str:
+        """
+        Path of the cached parse for a markers file
+        
+        The key covers the file's path, mtime and size, so editing the
+        database invalidates its cache entry.
+        
+        Args:
+            markers_file: Path to markers.tab file
+            
+        Returns:
+            Path to the pickle for this version of the file
+        """
+        stat = os.stat(markers_file)
+        key = (f"{MARKERS_CACHE_VERSION}:{os.path.abspath(markers_file)}:"
+               f"{stat.st_mtime_ns}:{stat.st_size}")
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(MARKERS_CACHE_DIR, digest + '.pkl')
+    
+    def _read_markers_cache(self, cache_file: str) -> Optional[Tuple[Dict, Dict]]:
+        # Any unreadable, stale-format or wrongly shaped cache is just a miss
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            return None
+        
+        if (isinstance(cached, tuple) and len(cached) == 2
+                and all(isinstance(part, dict) for part in cached)):
+            return cached
+        return None
+    
+    def _write_markers_cache(self, cache_file: str, entry: Tuple[Dict, Dict]):
+        # Caching is best effort; a read-only home must not break the tool.
+        # The pickle is written to a temporary file and renamed into place,
+        # so a concurrent run never reads a half-written entry
+        cache_dir = os.path.dirname(cache_file)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        except OSError:
+            return
+        
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    
     def _load_default_markers(self):
         # Basic restriction sites
         default_re = {
-            'EcoRI': 'GAATTC',
-            'BamHI': 'GGATCC',
-            'HindIII': 'AAGCTT',
-            'PstI': 'CTGCAG',
-            'SalI': 'GTCGAC',
-            'XbaI': 'TCTAGA',
-            'KpnI': 'GGTACC',
-            'SacI': 'GAGCTC',
-            'SmaI': 'CCCGGG',
-            'SphI': 'GCATGC'
+            'EcoRI': b'GAATTC',
+            'BamHI': b'GGATCC',
+            'HindIII': b'AAGCTT',
+            'PstI': b'CTGCAG',
+            'SalI': b'GTCGAC',
+            'XbaI': b'TCTAGA',
+            'KpnI': b'GGTACC',
+            'SacI': b'GAGCTC',
+            'SmaI': b'CCCGGG',
+            'SphI': b'GCATGC'
         }
         
         for name, seq in default_re.items():
@@ -95,7 +317,7 @@ class PlasmidDesigner:
             }
             self.restriction_sites[name] = seq
     
-    def read_fasta(self, fasta_file: str) -> Tuple[str, str]:
+    def read_fasta(self, fasta_file: str) -> Tuple[str, bytes]:
         """
         Read a FASTA file and return header and sequence
         
@@ -105,20 +327,9 @@ class PlasmidDesigner:
         Returns:
             Tuple of (header, sequence)
         """
-        header = ""
-        sequence = ""
-        
-        with open(fasta_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('>'):
-                    header = line[1:]
-                else:
-                    sequence += line.upper()
-                    
-        return header, sequence
+        return parse_fasta(fasta_file)
     
-    def find_ori_by_pattern(self, sequence: str) -> Optional[str]:
+    def find_ori_by_pattern(self, sequence: bytes) -> Optional[bytes]:
         """
         Find origin of replication by looking for known ORI patterns
         
@@ -136,13 +347,22 @@ class PlasmidDesigner:
         max_at = 0
         best_ori_pos = 0
         
-        for i in range(len(sequence) - window_size):
-            window = sequence[i:i+window_size]
-            at_content = (window.count('A') + window.count('T')) / len(window)
-            
-            if at_content > max_at:
-                max_at = at_content
-                best_ori_pos = i
+        # Slide a running A/T count: each step adds the base entering the
+        # window and drops the one leaving it, instead of recounting all
+        # 200 bp, and needs no per-window list (translating through a fixed
+        # table gives one 0/1 flag byte per base in C)
+        flags = sequence.translate(AT_FLAGS)
+        n_windows = len(sequence) - window_size
+        
+        if n_windows > 0:
+            at = best_at = sum(flags[:window_size])
+            for i in range(1, n_windows):
+                at += flags[i + window_size - 1] - flags[i - 1]
+                # Strict > keeps the first maximum
+                if at > best_at:
+                    best_at = at
+                    best_ori_pos = i
+            max_at = best_at / window_size
         
         # Extract ~500bp region around the high AT content region
         ori_start = max(0, best_ori_pos - 150)
@@ -154,7 +374,7 @@ class PlasmidDesigner:
         
         return ori_candidate
     
-    def find_ori_by_gc_skew(self, sequence: str, window: int = 100) -> Optional[str]:
+    def find_ori_by_gc_skew(self, sequence: bytes, window: int = 100) -> Optional[bytes]:
         """
         Find ORI using GC skew analysis
         GC skew = (G-C)/(G+C)
@@ -167,23 +387,20 @@ class PlasmidDesigner:
         Returns:
             ORI sequence if found
         """
-        gc_skew = []
+        window_starts = range(0, len(sequence) - window, window)
         
-        for i in range(0, len(sequence) - window, window):
-            subseq = sequence[i:i+window]
-            g_count = subseq.count('G')
-            c_count = subseq.count('C')
+        def gc_skew(start):
+            # count() with bounds scans in place instead of copying a slice
+            g_count = sequence.count(b'G', start, start + window)
+            c_count = sequence.count(b'C', start, start + window)
             
             if (g_count + c_count) > 0:
-                skew = (g_count - c_count) / (g_count + c_count)
-            else:
-                skew = 0
-                
-            gc_skew.append((i, skew))
+                return (g_count - c_count) / (g_count + c_count)
+            return 0
         
         # Find minimum skew (characteristic of ORI)
-        if gc_skew:
-            min_pos = min(gc_skew, key=lambda x: x[1])[0]
+        if window_starts:
+            min_pos = min(window_starts, key=gc_skew)
             
             # Extract region around minimum
             ori_start = max(0, min_pos - 250)
@@ -194,7 +411,7 @@ class PlasmidDesigner:
         
         return None
     
-    def find_ori_in_sequence(self, sequence: str) -> str:
+    def find_ori_in_sequence(self, sequence: bytes) -> bytes:
         """
         Find origin of replication using multiple methods
         
@@ -209,10 +426,11 @@ class PlasmidDesigner:
         # Method 1: Check if we have known ORI in markers
         if 'ori_pMB1' in self.markers:
             ori_seq = self.markers['ori_pMB1']['sequence']
-            if ori_seq in sequence:
+            # A single find() both tests for and locates the ORI
+            pos = sequence.find(ori_seq)
+            if pos != -1:
                 print("Found known ori_pMB1 in sequence!")
                 # Extract with some flanking region
-                pos = sequence.find(ori_seq)
                 start = max(0, pos - 50)
                 end = min(len(sequence), pos + len(ori_seq) + 50)
                 return sequence[start:end]
@@ -276,7 +494,7 @@ class PlasmidDesigner:
         
         return design
     
-    def build_mcs(self, mcs_sites: List[Tuple[str, str]]) -> str:
+    def build_mcs(self, mcs_sites: List[Tuple[str, str]]) -> bytes:
         """
         Build the multiple cloning site region
         
@@ -286,30 +504,30 @@ class PlasmidDesigner:
         Returns:
             MCS sequence
         """
-        mcs_sequence = ""
+        mcs_sequence = b""
         
         # Add spacer before MCS
-        mcs_sequence += "GGGCCC"  # SmaI site as spacer
+        mcs_sequence += b"GGGCCC"  # SmaI site as spacer
         
         for name, enzyme in mcs_sites:
             if enzyme in self.markers:
                 site_seq = self.markers[enzyme]['sequence']
                 mcs_sequence += site_seq
-                print(f"  Added {enzyme} site: {site_seq}")
+                print(f"  Added {enzyme} site: {site_seq.decode()}")
             elif enzyme in self.restriction_sites:
                 site_seq = self.restriction_sites[enzyme]
                 mcs_sequence += site_seq
-                print(f"  Added {enzyme} site: {site_seq}")
+                print(f"  Added {enzyme} site: {site_seq.decode()}")
             else:
                 print(f"  Warning: {enzyme} not found in markers database")
         
         # Add spacer after MCS
-        mcs_sequence += "GGGCCC"
+        mcs_sequence += b"GGGCCC"
         
         return mcs_sequence
     
-    def construct_plasmid(self, ori_seq: str, design: Dict, 
-                         remove_sites: Optional[List[str]] = None) -> str:
+    def construct_plasmid(self, ori_seq: bytes, design: Dict, 
+                         remove_sites: Optional[List[str]] = None) -> bytes:
         """
         Construct the final plasmid sequence
         
@@ -355,9 +573,7 @@ class PlasmidDesigner:
             plasmid_parts.append(("MCS", mcs_seq))
         
         # 4. Combine all parts
-        plasmid_sequence = ""
-        for part_name, part_seq in plasmid_parts:
-            plasmid_sequence += part_seq
+        plasmid_sequence = b''.join(part_seq for part_name, part_seq in plasmid_parts)
         
         # 5. Remove specified restriction sites from non-MCS regions
         if remove_sites:
@@ -370,8 +586,8 @@ class PlasmidDesigner:
         
         return plasmid_sequence
     
-    def remove_restriction_sites(self, sequence: str, sites_to_remove: List[str],
-                                mcs_sites: List[Tuple[str, str]]) -> str:
+    def remove_restriction_sites(self, sequence: bytes, sites_to_remove: List[str],
+                                mcs_sites: List[Tuple[str, str]]) -> bytes:
         """
         Remove specified restriction sites from sequence
         (but preserve them in MCS if they're part of the design)
@@ -387,29 +603,40 @@ class PlasmidDesigner:
         # Get list of sites that should be preserved (in MCS)
         preserve_sites = [enzyme for name, enzyme in mcs_sites]
         
-        modified_seq = sequence
-        
+        sites = {}
         for site_name in sites_to_remove:
             # Skip if this site should be preserved in MCS
             if site_name in preserve_sites:
                 continue
                 
             if site_name in self.restriction_sites:
-                site_seq = self.restriction_sites[site_name]
-                
-                # Count occurrences
-                count = modified_seq.count(site_seq)
-                
-                if count > 0:
-                    # Simple removal: introduce silent mutation
-                    # For this implementation, we'll just remove the site
-                    # In practice, you'd want to maintain reading frames
-                    modified_seq = modified_seq.replace(site_seq, 'N' * len(site_seq))
-                    print(f"  Removed {count} occurrence(s) of {site_name} ({site_seq})")
+                sites[site_name] = self.restriction_sites[site_name]
+        
+        if not sites:
+            return sequence
+        
+        # Mask every site in one pass over the sequence instead of a
+        # count + replace pass per enzyme
+        pattern = re.compile(b'|'.join(re.escape(site_seq) for site_seq in sites.values()))
+        counts = defaultdict(int)
+        
+        def mask(match):
+            # Simple removal: introduce silent mutation
+            # For this implementation, we'll just remove the site
+            # In practice, you'd want to maintain reading frames
+            counts[match.group()] += 1
+            return b'N' * len(match.group())
+        
+        modified_seq = pattern.sub(mask, sequence)
+        
+        for site_name, site_seq in sites.items():
+            count = counts.pop(site_seq, 0)
+            if count > 0:
+                print(f"  Removed {count} occurrence(s) of {site_name} ({site_seq.decode()})")
         
         return modified_seq
     
-    def write_fasta(self, filename: str, header: str, sequence: str):
+    def write_fasta(self, filename: str, header: str, sequence: bytes):
         """
         Write sequence to FASTA file
         
@@ -418,16 +645,17 @@ class PlasmidDesigner:
             header: FASTA header
             sequence: DNA sequence
         """
-        with open(filename, 'w') as f:
-            f.write(f">{header}\n")
-            
-            # Write sequence in 60-character lines
-            for i in range(0, len(sequence), 60):
-                f.write(sequence[i:i+60] + '\n')
+        # Write sequence in 60-character lines, assembled into one
+        # buffer so the file gets a single write call
+        record = [f">{header}\n".encode()]
+        record.extend(sequence[i:i+60] + b'\n' for i in range(0, len(sequence), 60))
+        
+        with open(filename, 'wb') as f:
+            f.write(b''.join(record))
         
         print(f"\nOutput written to: {filename}")
     
-    def analyze_plasmid(self, sequence: str) -> Dict:
+    def analyze_plasmid(self, sequence: bytes) -> Dict:
         """
         Analyze plasmid sequence for various features
         
@@ -439,15 +667,15 @@ class PlasmidDesigner:
         """
         analysis = {
             'length': len(sequence),
-            'gc_content': (sequence.count('G') + sequence.count('C')) / len(sequence) * 100,
+            'gc_content': (sequence.count(b'G') + sequence.count(b'C')) / len(sequence) * 100,
             'restriction_sites': {}
         }
         
         # Find restriction sites
+        hits = find_site_positions(self.site_patterns, sequence)
         for enzyme, site in self.restriction_sites.items():
-            count = sequence.count(site)
-            if count > 0:
-                analysis['restriction_sites'][enzyme] = count
+            if site in hits:
+                analysis['restriction_sites'][enzyme] = len(hits[site])
         
         return analysis
     
@@ -465,23 +693,34 @@ class PlasmidDesigner:
             print("  None found")
 
 
-def main():
-    """Main function"""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main function
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Exit status
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
     print("="*60)
     print("Plasmid Design Tool")
     print("="*60)
     
     # Check command line arguments
-    if len(sys.argv) < 4:
+    if len(argv) < 3:
         print("\nUsage: python plasmid_designer.py <input.fa> <design.txt> <output.fa> [markers.tab]")
         print("\nExample:")
         print("  python plasmid_designer.py pUC19.fa Design_pUC19.txt Output.fa markers.tab")
-        sys.exit(1)
+        return 1
     
-    input_fasta = sys.argv[1]
-    design_file = sys.argv[2]
-    output_fasta = sys.argv[3]
-    markers_file = sys.argv[4] if len(sys.argv) > 4 else "markers.tab"
+    input_fasta = argv[0]
+    design_file = argv[1]
+    output_fasta = argv[2]
+    markers_file = argv[3] if len(argv) > 3 else "markers.tab"
     
     # Initialize designer
     designer = PlasmidDesigner(markers_file)
@@ -517,7 +756,9 @@ def main():
     print("\n" + "="*60)
     print("Plasmid design completed successfully!")
     print("="*60)
+    
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())